@@ -0,0 +1,690 @@
+"""Reciprocity engine and agent simulation for the Kinetic Exchange points system.
+
+Models the share-to-earn / read-to-spend economy shown in index.html:
+clinics stake credits to publish anonymised patient history, spend credits
+to read, and a matching pool redistributes a cut of read fees back to the
+round's contributors. `simulate` runs the default 200-clinic, 45-round
+scenario and reports aggregate behaviour (opt-in rate, reads, publishes,
+disputes).
+
+Per-clinic state is held as a structure-of-arrays (`ClinicArrays`) indexed
+by integer clinic id, so per-round decisions are computed as vectorized
+boolean masks rather than a Python-level loop over clinic objects.
+"""
+
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy fallback below is used
+    njit = None
+    prange = range
+
+# Round-decision behaviour shared by the scalar and batch simulations:
+# clinics below the credit threshold publish regardless of propensity, and
+# each opted-in clinic attempts a read with this per-round probability.
+_LOW_CREDIT_THRESHOLD = 6
+_READ_PROBABILITY = 0.55
+
+
+def _decide_round_numpy(
+    credits,
+    opted_in,
+    share_propensity,
+    free_ride,
+    u_read,
+    u_share,
+    publish_stake,
+    min_credits_to_read,
+    read_cost,
+    low_credit_threshold,
+    read_probability,
+):
+    needs_credits = credits < low_credit_threshold
+    publish_mask = (
+        ~free_ride
+        & opted_in
+        & (credits >= publish_stake)
+        & (needs_credits | (u_share < share_propensity))
+    )
+    read_mask = (
+        opted_in
+        & (u_read < read_probability)
+        & (credits >= min_credits_to_read)
+        & (credits >= read_cost)
+    )
+    return publish_mask, read_mask
+
+
+def _decide_round_kernel(
+    credits,
+    opted_in,
+    share_propensity,
+    free_ride,
+    u_read,
+    u_share,
+    publish_stake,
+    min_credits_to_read,
+    read_cost,
+    low_credit_threshold,
+    read_probability,
+):
+    n = credits.shape[0]
+    publish_mask = np.empty(n, np.bool_)
+    read_mask = np.empty(n, np.bool_)
+    for i in prange(n):
+        c = credits[i]
+        publish_mask[i] = (
+            opted_in[i]
+            and not free_ride[i]
+            and c >= publish_stake
+            and (c < low_credit_threshold or u_share[i] < share_propensity[i])
+        )
+        read_mask[i] = (
+            opted_in[i]
+            and u_read[i] < read_probability
+            and c >= min_credits_to_read
+            and c >= read_cost
+        )
+    return publish_mask, read_mask
+
+
+if njit is not None:
+    _decide_round = njit(parallel=True, fastmath=True, cache=True)(
+        _decide_round_kernel
+    )
+else:
+    _decide_round = _decide_round_numpy
+
+
+@dataclass(slots=True)
+class Clinic:
+    """Registration profile for a participating clinic."""
+
+    clinic_id: str
+    share_propensity: float
+    free_ride: bool = False
+    low_quality: bool = False
+    credits: int = 10
+    reputation: float = 0.5
+    opted_in: bool = True
+
+
+# Display summaries are fixed per quality band; entries store only the band
+# index and resolve to these constants on materialization.
+_SUMMARY_LOW = "Generic note: exercises advised. (low detail)"
+_SUMMARY_HIGH = "Structured summary: condition, modalities, progress markers."
+_SUMMARY_BY_BAND = (_SUMMARY_LOW, _SUMMARY_HIGH)
+
+
+@dataclass(slots=True)
+class HistoryEntry:
+    """One anonymised patient-history record published to the exchange.
+
+    Materialized on demand from the engine's columnar history store; see
+    `ReciprocityEngine.get_entry`. Patients are identified by their integer
+    index; `ReciprocityEngine._patient_label` renders the display id.
+    """
+
+    patient_id: int
+    author_clinic_id: str
+    quality_score: float
+    summary: str
+    stake: int
+    timestamp: float
+
+
+@dataclass(slots=True)
+class AccessToken:
+    """Patient-scoped read grant issued to a single clinic."""
+
+    patient_id: int
+    issued_to_clinic_id: str
+    expires_at: float
+
+
+@dataclass(slots=True)
+class ClinicArrays:
+    """Structure-of-arrays clinic state, indexed by integer clinic id."""
+
+    credits: np.ndarray
+    reputation: np.ndarray
+    opted_in: np.ndarray
+    share_propensity: np.ndarray
+    free_ride: np.ndarray
+    low_quality: np.ndarray
+    last_round_contribution: np.ndarray
+
+    @classmethod
+    def empty(cls, capacity: int) -> "ClinicArrays":
+        # Dtypes are sized to the simulated ranges (credits are capped, a
+        # clinic contributes at most a handful of records per round) so each
+        # round moves a fraction of the bytes that default 8-byte dtypes
+        # would.
+        return cls(
+            credits=np.zeros(capacity, dtype=np.int16),
+            reputation=np.zeros(capacity, dtype=np.float32),
+            opted_in=np.zeros(capacity, dtype=np.bool_),
+            share_propensity=np.zeros(capacity, dtype=np.float32),
+            free_ride=np.zeros(capacity, dtype=np.bool_),
+            low_quality=np.zeros(capacity, dtype=np.bool_),
+            last_round_contribution=np.zeros(capacity, dtype=np.uint8),
+        )
+
+
+class ReciprocityEngine:
+    """Credit ledger, history store and access control for the exchange."""
+
+    def __init__(
+        self,
+        capacity: int,
+        read_cost: int = 6,
+        publish_reward: int = 12,
+        detailed_reward: int = 18,
+        publish_stake: int = 2,
+        min_credits_to_read: int = 6,
+        match_pool_rate: float = 0.5,
+        decay_per_round: int = 1,
+        dispute_rate: float = 0.3,
+        credit_cap: int = 40,
+        keep_entry_index: bool = False,
+        audit_enabled: bool = False,
+    ) -> None:
+        self.read_cost = read_cost
+        self.publish_reward = publish_reward
+        self.detailed_reward = detailed_reward
+        self.publish_stake = publish_stake
+        self.min_credits_to_read = min_credits_to_read
+        self.match_pool_rate = match_pool_rate
+        self.decay_per_round = decay_per_round
+        self.dispute_rate = dispute_rate
+        self.credit_cap = credit_cap
+
+        # Simulation clock: advanced explicitly (one tick per round) instead
+        # of consulting wall-clock time on every token check and log write.
+        self._now: float = 0.0
+
+        self.arrays = ClinicArrays.empty(capacity)
+        self.clinics: Dict[str, int] = {}
+        self.clinic_ids: List[str] = []
+        self.n_clinics = 0
+        # Running tally of opted-in clinics, adjusted on registration and in
+        # apply_opt_outs, so opt_in_rate never rescans the membership array.
+        self._opted_in_count = 0
+        # One reusable token per clinic; issue_patient_token re-points it at
+        # the requested patient rather than allocating a fresh AccessToken.
+        self._token_pool: List[AccessToken] = []
+        self.pool_balance = 0
+        # Round total of last_round_contribution, maintained on publish so
+        # finalize_round never re-sums the contribution array.
+        self._total_contribs = 0
+        # Read auditing is opt-in: the unbounded (time, clinic, patient) log
+        # is only worth its allocations when someone is going to read it.
+        self.audit_enabled = audit_enabled
+        self.access_log: List[Tuple[float, str, str]] = []
+
+        # Columnar history store: parallel arrays indexed by entry id, with
+        # per-patient entry-id lists for lookup. Entries are materialized as
+        # HistoryEntry only on demand via get_entry.
+        history_capacity = 1024
+        self._authors = np.empty(history_capacity, dtype=np.int32)
+        self._qscores = np.empty(history_capacity, dtype=np.float32)
+        self._stakes = np.empty(history_capacity, dtype=np.int8)
+        self._bands = np.empty(history_capacity, dtype=np.uint8)
+        self._timestamps = np.empty(history_capacity, dtype=np.float64)
+        self._patients = np.empty(history_capacity, dtype=np.int32)
+        self.n_entries = 0
+
+        # Patients are integers internally; string ids are interned to a
+        # dense index at the public boundary and re-emitted only for display
+        # and auditing (_patient_label).
+        self._patient_index: Dict[str, int] = {}
+        self.patient_ids: List[str] = []
+
+        # Per-patient aggregates: readers only need to know whether history
+        # exists, so publishes bump a count (and record the latest quality)
+        # instead of growing per-patient entry lists. The full entry-id index
+        # is kept only when keep_entry_index is set (debugging/inspection).
+        patient_capacity = 1024
+        self.patient_entry_count = np.zeros(patient_capacity, dtype=np.uint16)
+        self.patient_latest_quality = np.zeros(patient_capacity, dtype=np.float32)
+        self.keep_entry_index = keep_entry_index
+        self.patient_histories: Dict[int, List[int]] = {}
+
+    def add_clinic(self, clinic: Clinic) -> int:
+        """Register a clinic and return its integer id."""
+        if clinic.clinic_id in self.clinics:
+            raise ValueError(f"clinic {clinic.clinic_id!r} already registered")
+        idx = self.n_clinics
+        if idx >= len(self.arrays.credits):
+            raise ValueError("engine is at capacity")
+        a = self.arrays
+        a.credits[idx] = clinic.credits
+        a.reputation[idx] = clinic.reputation
+        a.opted_in[idx] = clinic.opted_in
+        a.share_propensity[idx] = clinic.share_propensity
+        a.free_ride[idx] = clinic.free_ride
+        a.low_quality[idx] = clinic.low_quality
+        self.clinics[clinic.clinic_id] = idx
+        self.clinic_ids.append(clinic.clinic_id)
+        self._token_pool.append(
+            AccessToken(
+                patient_id=-1,
+                issued_to_clinic_id=clinic.clinic_id,
+                expires_at=0.0,
+            )
+        )
+        self.n_clinics += 1
+        self._opted_in_count += clinic.opted_in
+        return idx
+
+    def _intern_patient(self, patient_id: str) -> int:
+        pidx = self._patient_index.setdefault(patient_id, len(self._patient_index))
+        if pidx == len(self.patient_ids):
+            self.patient_ids.append(patient_id)
+        return pidx
+
+    def _patient_label(self, patient_idx: int) -> str:
+        if patient_idx < len(self.patient_ids):
+            return self.patient_ids[patient_idx]
+        return f"P{patient_idx:04d}"
+
+    def issue_patient_token(
+        self, patient_id: str, clinic_id: str, ttl_seconds: int = 3600
+    ) -> AccessToken:
+        return self._issue_patient_token(
+            self._intern_patient(patient_id), self.clinics[clinic_id], ttl_seconds
+        )
+
+    def _issue_patient_token(
+        self, patient_idx: int, idx: int, ttl_seconds: int = 3600
+    ) -> AccessToken:
+        token = self._token_pool[idx]
+        token.patient_id = patient_idx
+        token.expires_at = self._now + ttl_seconds
+        return token
+
+    def can_read(self, clinic_id: str, token: AccessToken) -> bool:
+        return self._can_read(self.clinics[clinic_id], token)
+
+    def _can_read(self, idx: int, token: AccessToken) -> bool:
+        # Ordered cheapest and most-selective first: the credit floor is the
+        # check that usually fails mid-run, so the token comparisons and the
+        # expiry test are only reached for clinics that can actually pay.
+        return bool(
+            self.arrays.credits[idx] >= self.min_credits_to_read
+            and self.arrays.opted_in[idx]
+            and token.issued_to_clinic_id == self.clinic_ids[idx]
+            and self._now <= token.expires_at
+        )
+
+    def read_history(self, clinic_id: str, token: AccessToken) -> int:
+        """Charge the read fee, feed the matching pool and return the record.
+
+        Returns the patient's entry count (0 when no history exists). Full
+        records are only reachable through patient_histories and get_entry
+        when the engine was built with keep_entry_index.
+        """
+        return self._read_history(self.clinics[clinic_id], token)
+
+    def _read_history(self, idx: int, token: AccessToken) -> int:
+        self.arrays.credits[idx] -= self.read_cost
+        self.pool_balance += int(self.read_cost * self.match_pool_rate)
+        if self.audit_enabled:
+            self.access_log.append(
+                (self._now, self.clinic_ids[idx], self._patient_label(token.patient_id))
+            )
+        pidx = token.patient_id
+        if pidx >= len(self.patient_entry_count):
+            return 0
+        return int(self.patient_entry_count[pidx])
+
+    def publish_history(
+        self, clinic_id: str, patient_id: str, quality_score: float
+    ) -> bool:
+        """Publish a record under stake; returns True if the entry was disputed.
+
+        A disputed entry forfeits the stake to the matching pool; otherwise
+        the stake is returned along with the quality-banded reward.
+        """
+        return self._publish_history(
+            self.clinics[clinic_id], self._intern_patient(patient_id), quality_score
+        )
+
+    def _publish_history(
+        self, idx: int, patient_idx: int, quality_score: float
+    ) -> bool:
+        a = self.arrays
+        a.credits[idx] -= self.publish_stake
+        entry_id = self.n_entries
+        if entry_id == len(self._authors):
+            self._grow_history()
+        self._authors[entry_id] = idx
+        self._qscores[entry_id] = quality_score
+        self._stakes[entry_id] = self.publish_stake
+        self._bands[entry_id] = quality_score >= 0.6
+        self._timestamps[entry_id] = self._now
+        self._patients[entry_id] = patient_idx
+        while patient_idx >= len(self.patient_entry_count):
+            self._grow_patients()
+        self.patient_entry_count[patient_idx] += 1
+        self.patient_latest_quality[patient_idx] = quality_score
+        if self.keep_entry_index:
+            self.patient_histories.setdefault(patient_idx, []).append(entry_id)
+        self.n_entries += 1
+        a.last_round_contribution[idx] += 1
+        self._total_contribs += 1
+        disputed = self._maybe_dispute(quality_score)
+        if disputed:
+            self.pool_balance += self.publish_stake
+            a.reputation[idx] = max(0.0, a.reputation[idx] - 0.05)
+        else:
+            reward = (
+                self.detailed_reward if quality_score >= 0.6 else self.publish_reward
+            )
+            a.credits[idx] = min(
+                self.credit_cap, int(a.credits[idx]) + reward + self.publish_stake
+            )
+            a.reputation[idx] = min(1.0, a.reputation[idx] + 0.01)
+        return disputed
+
+    def get_entry(self, entry_id: int) -> HistoryEntry:
+        """Materialize a full HistoryEntry from the columnar store."""
+        return HistoryEntry(
+            patient_id=int(self._patients[entry_id]),
+            author_clinic_id=self.clinic_ids[self._authors[entry_id]],
+            quality_score=float(self._qscores[entry_id]),
+            summary=_SUMMARY_BY_BAND[self._bands[entry_id]],
+            stake=int(self._stakes[entry_id]),
+            timestamp=float(self._timestamps[entry_id]),
+        )
+
+    def _grow_history(self) -> None:
+        new_capacity = 2 * len(self._authors)
+        for name in (
+            "_authors",
+            "_qscores",
+            "_stakes",
+            "_bands",
+            "_timestamps",
+            "_patients",
+        ):
+            old = getattr(self, name)
+            grown = np.empty(new_capacity, dtype=old.dtype)
+            grown[: self.n_entries] = old[: self.n_entries]
+            setattr(self, name, grown)
+
+    def _grow_patients(self) -> None:
+        new_capacity = 2 * len(self.patient_entry_count)
+        for name in ("patient_entry_count", "patient_latest_quality"):
+            old = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=old.dtype)
+            grown[: len(old)] = old
+            setattr(self, name, grown)
+
+    def _maybe_dispute(self, quality_score: float) -> bool:
+        # quality_score arrives as a NumPy scalar on the hot path; wrap the
+        # comparison so callers get a plain bool rather than np.bool_.
+        return bool(quality_score < 0.5 and random.random() < self.dispute_rate)
+
+    def finalize_round(self) -> None:
+        """Close out a round: decay credits, split the matching pool across
+        the round's contributors pro rata and reset the round counters.
+
+        Fused into one pass over the clinic arrays rather than separate
+        decay / distribute / reset walks.
+        """
+        a = self.arrays
+        credits = a.credits[: self.n_clinics]
+        contrib = a.last_round_contribution[: self.n_clinics]
+        decayed = np.maximum(
+            0, credits - self.decay_per_round * a.opted_in[: self.n_clinics]
+        )
+        if self._total_contribs > 0 and self.pool_balance > 0:
+            # Widen before multiplying: the pool balance overflows the narrow
+            # contribution dtype.
+            shares = self.pool_balance * contrib.astype(np.int64) // self._total_contribs
+            decayed += shares.astype(decayed.dtype)
+            np.minimum(decayed, self.credit_cap, out=decayed)
+        credits[:] = decayed
+        contrib[:] = 0
+        self._total_contribs = 0
+        self.pool_balance = 0
+
+    def apply_opt_outs(self, mask: np.ndarray) -> None:
+        """Opt out the masked clinics, keeping the opted-in tally current."""
+        opted_in = self.arrays.opted_in[: self.n_clinics]
+        leaving = opted_in & mask[: self.n_clinics]
+        n_leaving = int(np.count_nonzero(leaving))
+        if n_leaving:
+            opted_in &= ~leaving
+            self._opted_in_count -= n_leaving
+
+    def opt_in_rate(self) -> float:
+        if self.n_clinics == 0:
+            return 0.0
+        return self._opted_in_count / self.n_clinics
+
+
+def simulate(
+    seed: int = 7,
+    n_clinics: int = 200,
+    rounds: int = 45,
+    n_patients: int = 1000,
+) -> Dict[str, float]:
+    """Run the default exchange scenario and return aggregate outcomes."""
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    engine = ReciprocityEngine(capacity=n_clinics)
+    setup = rng.random((n_clinics, 3))
+    for i in range(n_clinics):
+        engine.add_clinic(
+            Clinic(
+                clinic_id=f"C{i:03d}",
+                share_propensity=0.2 + 0.7 * setup[i, 0],
+                free_ride=setup[i, 1] < 0.15,
+                low_quality=setup[i, 2] < 0.25,
+            )
+        )
+    a = engine.arrays
+
+    total_reads = 0
+    total_publishes = 0
+    total_disputes = 0
+    for _ in range(rounds):
+        # One batched Generator call per round covers every clinic's
+        # decision uniforms: slot 0 read action, 1 share-propensity gate,
+        # 2 low-quality branch, 3 opt-out, 4 quality draw. Patient picks
+        # are a single integer draw (column 0 publish, column 1 read).
+        U = rng.random((n_clinics, 5))
+        Pidx = rng.integers(0, n_patients, (n_clinics, 2))
+        publish_mask, read_mask = _decide_round(
+            a.credits,
+            a.opted_in,
+            a.share_propensity,
+            a.free_ride,
+            np.ascontiguousarray(U[:, 0]),
+            np.ascontiguousarray(U[:, 1]),
+            engine.publish_stake,
+            engine.min_credits_to_read,
+            engine.read_cost,
+            _LOW_CREDIT_THRESHOLD,
+            _READ_PROBABILITY,
+        )
+
+        # Quality scores for the whole round in one branchless pass: low
+        # contributions land in [0.1, 0.5), everything else in [0.6, 1.0).
+        low = a.low_quality & (U[:, 2] < 0.6)
+        quality = np.where(low, 0.1 + 0.4 * U[:, 4], 0.6 + 0.4 * U[:, 4])
+
+        for i in np.flatnonzero(publish_mask):
+            total_publishes += 1
+            total_disputes += engine._publish_history(i, int(Pidx[i, 0]), quality[i])
+
+        for i in np.flatnonzero(read_mask):
+            token = engine._issue_patient_token(int(Pidx[i, 1]), i)
+            if engine._can_read(i, token):
+                history = engine._read_history(i, token)
+                if history:
+                    total_reads += 1
+
+        engine.finalize_round()
+        engine._now += 1.0
+
+        # Clinics that hit zero credits occasionally drop out of the exchange.
+        engine.apply_opt_outs((a.credits == 0) & (U[:, 3] < 0.05))
+
+    return {
+        "rounds": rounds,
+        "n_clinics": n_clinics,
+        "total_reads": total_reads,
+        "total_publishes": total_publishes,
+        "total_disputes": total_disputes,
+        "opt_in_rate": engine.opt_in_rate(),
+        "mean_credits": float(a.credits[:n_clinics].mean()),
+        "mean_reputation": float(a.reputation[:n_clinics].mean()),
+    }
+
+
+def simulate_batch(
+    seed: int = 7,
+    n_replications: int = 8,
+    n_clinics: int = 200,
+    rounds: int = 45,
+    n_patients: int = 1000,
+    read_cost: int = 6,
+    publish_reward: int = 12,
+    detailed_reward: int = 18,
+    publish_stake: int = 2,
+    min_credits_to_read: int = 6,
+    match_pool_rate: float = 0.5,
+    decay_per_round: int = 1,
+    dispute_rate: float = 0.3,
+    credit_cap: int = 40,
+) -> List[Dict[str, float]]:
+    """Evolve many independent replications in lockstep on 2-D arrays.
+
+    Every state array carries a leading replication axis, so one pass over
+    the round loop advances all realizations at once; per-round randomness
+    comes from a single (n_replications, n_clinics, 6) draw. Applies the
+    same exchange rules as `simulate` but keeps only per-patient history
+    counts (no entry store or access log). Returns one summary per
+    replication.
+    """
+    rng = np.random.default_rng(seed)
+    shape = (n_replications, n_clinics)
+    setup = rng.random(shape + (3,))
+    share_propensity = 0.2 + 0.7 * setup[..., 0]
+    free_ride = setup[..., 1] < 0.15
+    low_quality = setup[..., 2] < 0.25
+    credits = np.full(shape, 10, dtype=np.int64)
+    reputation = np.full(shape, 0.5, dtype=np.float64)
+    opted_in = np.ones(shape, dtype=np.bool_)
+    contrib = np.zeros(shape, dtype=np.int64)
+    history_count = np.zeros((n_replications, n_patients), dtype=np.int64)
+    pool = np.zeros(n_replications, dtype=np.int64)
+
+    total_reads = np.zeros(n_replications, dtype=np.int64)
+    total_publishes = np.zeros(n_replications, dtype=np.int64)
+    total_disputes = np.zeros(n_replications, dtype=np.int64)
+    for _ in range(rounds):
+        # Slots 0-4 as in simulate; slot 5 drives dispute resolution.
+        U = rng.random(shape + (6,))
+        Pidx = rng.integers(0, n_patients, shape + (2,))
+        needs_credits = credits < _LOW_CREDIT_THRESHOLD
+        publish_mask = (
+            opted_in
+            & ~free_ride
+            & (credits >= publish_stake)
+            & (needs_credits | (U[..., 1] < share_propensity))
+        )
+        read_mask = (
+            opted_in
+            & (U[..., 0] < _READ_PROBABILITY)
+            & (credits >= min_credits_to_read)
+            & (credits >= read_cost)
+        )
+
+        low = low_quality & (U[..., 2] < 0.6)
+        quality = np.where(low, 0.1 + 0.4 * U[..., 4], 0.6 + 0.4 * U[..., 4])
+        disputed = publish_mask & (quality < 0.5) & (U[..., 5] < dispute_rate)
+        rewarded = publish_mask & ~disputed
+        reward = np.where(quality >= 0.6, detailed_reward, publish_reward)
+
+        rows, cols = np.nonzero(publish_mask)
+        np.add.at(history_count, (rows, Pidx[rows, cols, 0]), 1)
+        contrib += publish_mask
+        credits -= publish_stake * publish_mask
+        credits = np.where(
+            rewarded,
+            np.minimum(credit_cap, credits + reward + publish_stake),
+            credits,
+        )
+        pool += publish_stake * disputed.sum(axis=1)
+        reputation = np.where(
+            disputed,
+            np.maximum(0.0, reputation - 0.05),
+            np.where(rewarded, np.minimum(1.0, reputation + 0.01), reputation),
+        )
+        total_publishes += publish_mask.sum(axis=1)
+        total_disputes += disputed.sum(axis=1)
+
+        # Reads re-check the credit floor after publish effects, matching
+        # can_read in the scalar path.
+        executed = read_mask & (credits >= min_credits_to_read)
+        credits -= read_cost * executed
+        pool += int(read_cost * match_pool_rate) * executed.sum(axis=1)
+        rows, cols = np.nonzero(executed)
+        found = history_count[rows, Pidx[rows, cols, 1]] > 0
+        total_reads += np.bincount(rows[found], minlength=n_replications)
+
+        credits = np.maximum(0, credits - decay_per_round * opted_in)
+        total_contribs = contrib.sum(axis=1)
+        share = pool[:, None] * contrib // np.maximum(total_contribs, 1)[:, None]
+        share[(total_contribs == 0) | (pool == 0)] = 0
+        credits = np.minimum(credit_cap, credits + share)
+        contrib[:] = 0
+        pool[:] = 0
+
+        opted_in &= ~((credits == 0) & (U[..., 3] < 0.05))
+
+    return [
+        {
+            "rounds": rounds,
+            "n_clinics": n_clinics,
+            "total_reads": int(total_reads[r]),
+            "total_publishes": int(total_publishes[r]),
+            "total_disputes": int(total_disputes[r]),
+            "opt_in_rate": float(opted_in[r].mean()),
+            "mean_credits": float(credits[r].mean()),
+            "mean_reputation": float(reputation[r].mean()),
+        }
+        for r in range(n_replications)
+    ]
+
+
+def simulate_many(
+    seeds: Sequence[int], workers: Optional[int] = None
+) -> List[Dict[str, float]]:
+    """Run one independent replication per seed across worker processes.
+
+    Replications share no state, so they scale with core count; results are
+    returned in seed order. `workers=None` uses one process per CPU. Workers
+    are spawned rather than forked: forking a parent whose numba parallel
+    runtime is already initialized can deadlock at interpreter shutdown.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(executor.map(simulate, seeds))
+
+
+if __name__ == "__main__":
+    for key, value in simulate().items():
+        print(f"{key}: {value}")